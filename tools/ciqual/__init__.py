@@ -0,0 +1,30 @@
+"""
+CIQUAL tooling for the Lym Nutrition app
+========================================
+
+Data pipeline behind ``assets/data/common_ciqual.json`` and Python
+counterparts of the app's CIQUAL data handling:
+
+- ``python -m ciqual``: ``convert``, ``filter``, ``validate`` and ``stats``
+  subcommands (see ``ciqual.cli``)
+- ``ciqual.search``: in-memory query engine reproducing the tier scoring of
+  ``CiqualLocalDataSourceImpl.searchFoods``
+- ``ciqual.server``: asyncio HTTP endpoint with an LRU cache of normalized
+  queries
+- ``ciqual.loadtest``: latency report (p50/p99) against a running server
+- ``ciqual.budget``: asset size and decode-time budgets checked at build time
+
+Run the modules from the ``tools`` directory, e.g.
+``python -m ciqual.server ../assets/data/common_ciqual.json``.
+"""
+
+__all__ = ["FoodSearchEngine", "normalize_string"]
+
+
+def __getattr__(name):
+    # Every ``python -m ciqual`` run imports this package first: keep it
+    # empty and only load the search engine when it is asked for.
+    if name in __all__:
+        from . import search
+        return getattr(search, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+CIQUAL Asset Budget Report
+==========================
+
+Build stage run after the JSON asset is written and validated. The app loads
+``common_ciqual.json`` into SharedPreferences in ``initializeDatabase`` and
+``jsonDecode``s the whole string on every search, so a larger asset directly
+slows it down. This stage measures the asset:
+
+- raw and gzip-compressed size
+- record count and distinct column count
+- full-decode time (``json.loads`` of the file contents)
+- single-record lookup time (scan of the decoded list for the last
+  ``alim_code``, as ``getFoodByCode`` does after decoding)
+
+then compares the numbers with absolute budgets and with a stored baseline,
+prints a diff report and exits with status 1 when a budget is exceeded.
+
+``ciqual convert`` and ``ciqual filter`` run this stage on their output
+unless ``--no-budget-check`` is given, diffing against the committed
+``asset_baseline.json`` next to this module by default.
+
+Usage (from the ``tools`` directory):
+    python -m ciqual.budget ../assets/data/common_ciqual.json \\
+        --baseline ciqual/asset_baseline.json [--budgets budgets.json] [--update-baseline [--force]]
+
+The baseline is only rewritten when every budget is met, unless ``--force``
+is given to accept a deliberate change.
+
+A budgets file overrides ``DEFAULT_BUDGETS`` key by key. Timings are only
+enforced when it gives them a cap:
+    {"max": {"size_bytes": 500000, "decode_ms": 50}, "max_growth_pct": {"columns": 0}}
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+METRICS = [
+    ('size_bytes', 'Raw size (bytes)'),
+    ('gzip_bytes', 'Gzip size (bytes)'),
+    ('records', 'Records'),
+    ('columns', 'Columns'),
+    ('decode_ms', 'Full decode (ms)'),
+    ('lookup_ms', 'Single lookup (ms)'),
+]
+
+DEFAULT_BASELINE_PATH = str(Path(__file__).with_name('asset_baseline.json'))
+
+# Absolute caps, and growth allowed relative to the baseline. Timings depend
+# on the machine running the build, so they are reported but only enforced
+# when a budgets file sets a cap for them.
+DEFAULT_BUDGETS = {
+    'max': {
+        'size_bytes': 1_000_000,
+        'gzip_bytes': 150_000,
+        'records': 1_000,
+        'columns': 80,
+        'decode_ms': None,
+        'lookup_ms': None,
+    },
+    'max_growth_pct': {
+        'size_bytes': 10.0,
+        'gzip_bytes': 10.0,
+        'records': 10.0,
+        'columns': 0.0,
+    },
+}
+
+
+def _median_ms(func, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def measure_asset(json_file_path: str, repeats: int = 5) -> Dict[str, float]:
+    """
+    Measure size, shape and decode cost of a CIQUAL JSON asset.
+
+    Args:
+        json_file_path (str): Path to the JSON file (a list of food items)
+        repeats (int): Runs per timing; the median is kept
+
+    Returns:
+        Dict[str, float]: One value per entry of ``METRICS``
+    """
+    raw = Path(json_file_path).read_bytes()
+    text = raw.decode('utf-8')
+    data = json.loads(text)
+    if not isinstance(data, list):
+        raise ValueError(f"{json_file_path} should contain a list of food items")
+    if not all(isinstance(item, dict) for item in data):
+        raise ValueError(f"{json_file_path} should only contain food items (JSON objects)")
+
+    columns = set()
+    for item in data:
+        columns.update(item)
+
+    last_code = str(data[-1].get('alim_code', '')) if data else ''
+
+    def lookup():
+        return next((item for item in data if str(item.get('alim_code', '')) == last_code), None)
+
+    return {
+        'size_bytes': len(raw),
+        'gzip_bytes': len(gzip.compress(raw)),
+        'records': len(data),
+        'columns': len(columns),
+        'decode_ms': _median_ms(lambda: json.loads(text), repeats),
+        'lookup_ms': _median_ms(lookup, repeats),
+    }
+
+
+def _is_number(value) -> bool:
+    return not isinstance(value, bool) and isinstance(value, (int, float))
+
+
+def load_budgets(budgets_file_path: Optional[str] = None) -> dict:
+    """Return ``DEFAULT_BUDGETS`` updated with the entries of a budgets file."""
+    budgets = {section: dict(values) for section, values in DEFAULT_BUDGETS.items()}
+    if budgets_file_path:
+        with open(budgets_file_path, 'r', encoding='utf-8') as f:
+            overrides = json.load(f)
+        if not isinstance(overrides, dict):
+            raise ValueError(f"{budgets_file_path} should contain a JSON object")
+        for section, values in overrides.items():
+            if section not in budgets:
+                raise ValueError(f"Unknown budget section: {section}")
+            if not isinstance(values, dict):
+                raise ValueError(f"Budget section {section} should be a JSON object")
+            for key, value in values.items():
+                if key not in budgets['max']:
+                    raise ValueError(f"Unknown metric in budget section {section}: {key}")
+                if value is not None and not _is_number(value):
+                    raise ValueError(f"Budget {section}.{key} should be a number or null")
+            budgets[section].update(values)
+    return budgets
+
+
+def load_baseline(baseline_file_path: Optional[str] = None) -> Optional[dict]:
+    """Return the stored metrics, or None when there is no baseline file yet."""
+    if not baseline_file_path or not Path(baseline_file_path).exists():
+        return None
+    with open(baseline_file_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if not isinstance(baseline, dict):
+        raise ValueError(f"{baseline_file_path} should contain a JSON object of metrics")
+    for key, _ in METRICS:
+        value = baseline.get(key)
+        if value is not None and not _is_number(value):
+            raise ValueError(f"{baseline_file_path}: {key} should be a number")
+    return baseline
+
+
+def _format_value(value) -> str:
+    return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+
+def check_budgets(metrics: dict, budgets: dict, baseline: Optional[dict] = None) -> List[str]:
+    """Return a message for every budget the metrics exceed."""
+    violations = []
+    for key, label in METRICS:
+        value = metrics[key]
+        limit = budgets['max'].get(key)
+        if limit is not None and value > limit:
+            violations.append(
+                f"{label}: {_format_value(value)} exceeds budget {_format_value(limit)}"
+            )
+
+        growth_limit = budgets['max_growth_pct'].get(key)
+        if baseline and growth_limit is not None and baseline.get(key):
+            growth = (value - baseline[key]) / baseline[key] * 100
+            if growth > growth_limit:
+                violations.append(
+                    f"{label}: grew {growth:+.1f}% vs baseline (allowed {growth_limit:+.1f}%)"
+                )
+    return violations
+
+
+def format_report(metrics: dict, budgets: dict, baseline: Optional[dict] = None) -> str:
+    """Render the metrics as a table with the diff against the baseline."""
+    lines = [f"{'Metric':<20}{'Baseline':>12}{'Current':>12}{'Diff':>24}{'Budget':>12}"]
+    for key, label in METRICS:
+        value = metrics[key]
+        previous = baseline.get(key) if baseline else None
+        if previous is None:
+            base_text, diff_text = '-', '-'
+        else:
+            base_text = _format_value(previous)
+            diff = value - previous
+            diff_text = ('+' if diff >= 0 else '') + _format_value(diff)
+            if previous:
+                diff_text += f" ({diff / previous * 100:+.1f}%)"
+        limit = budgets['max'].get(key)
+        limit_text = '-' if limit is None else _format_value(limit)
+        lines.append(
+            f"{label:<20}{base_text:>12}{_format_value(value):>12}{diff_text:>24}{limit_text:>12}"
+        )
+    return "\n".join(lines)
+
+
+def run_budget_check(json_file_path: str, budgets_file_path: Optional[str] = None,
+                     baseline_file_path: Optional[str] = None,
+                     update_baseline: bool = False, force: bool = False) -> bool:
+    """
+    Measure the asset, print the report and optionally store a new baseline.
+
+    The baseline is only rewritten when every budget is met, or with ``force``.
+
+    Returns:
+        bool: True when every budget is met
+    """
+    budgets = load_budgets(budgets_file_path)
+    baseline = load_baseline(baseline_file_path)
+    metrics = measure_asset(json_file_path)
+
+    print(f"📏 Asset budget report for {json_file_path}")
+    print(format_report(metrics, budgets, baseline))
+
+    violations = check_budgets(metrics, budgets, baseline)
+    for violation in violations:
+        print(f"❌ {violation}")
+
+    if update_baseline and violations and not force:
+        print("⚠️  Baseline not updated: budgets exceeded (use --force to accept the change)")
+    elif update_baseline and baseline_file_path:
+        with open(baseline_file_path, 'w', encoding='utf-8') as f:
+            json.dump(metrics, f, indent=2)
+            f.write("\n")
+        print(f"📁 Baseline updated: {baseline_file_path}")
+
+    if not violations:
+        print("✅ All asset budgets met")
+    return not violations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check a CIQUAL JSON asset against size and decode-time budgets"
+    )
+    parser.add_argument("json_file", help="CIQUAL JSON asset to measure")
+    parser.add_argument("--budgets", help="JSON file overriding the default budgets")
+    parser.add_argument("--baseline", help="JSON file with the metrics to diff against")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the current metrics to the baseline file when every budget is met"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --update-baseline, write the baseline even if budgets are exceeded"
+    )
+
+    args = parser.parse_args()
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline requires --baseline")
+    if args.force and not args.update_baseline:
+        parser.error("--force requires --update-baseline")
+
+    try:
+        ok = run_budget_check(
+            args.json_file, args.budgets, args.baseline, args.update_baseline, args.force
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ Budget check error: {str(e)}")
+        sys.exit(1)
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+CIQUAL Command Line
+===================
+
+Single entry point for the CIQUAL data tooling:
+
+    python -m ciqual convert  <excel_file> <json_file>    (needs pandas, openpyxl)
+    python -m ciqual filter   <source_json> <json_file>
+    python -m ciqual validate <json_file>
+    python -m ciqual stats    <json_file>
+
+Only argparse is imported up front. Each subcommand lives in its own module,
+imported when that subcommand runs, so ``validate`` or ``stats`` never pay
+for pandas or the filter product tables.
+
+``--time-imports`` reports the subcommand import time and the CPU time used
+since interpreter start (which includes the ``ciqual`` package and this
+module). For a per-module breakdown, run
+``python -X importtime -m ciqual <command> ...``.
+"""
+
+import argparse
+import importlib
+import sys
+import time
+
+# Subcommand name -> module (relative to this package) exposing run(args)
+COMMANDS = {
+    'convert': '.convert',
+    'filter': '.filter',
+    'validate': '.validate',
+    'stats': '.stats',
+}
+
+
+def _add_output_checks(parser):
+    parser.add_argument(
+        "--validate-format",
+        action="store_true",
+        help="Validate that the output JSON matches the expected app format"
+    )
+    parser.add_argument(
+        "--no-budget-check",
+        action="store_true",
+        help="Skip the asset size and decode-time budget check run on the output"
+    )
+    parser.add_argument(
+        "--budgets",
+        help="JSON file overriding the default asset budgets"
+    )
+    parser.add_argument(
+        "--baseline",
+        help="JSON file with previous asset metrics to diff against "
+             "(default: ciqual/asset_baseline.json)"
+    )
+
+
+def _add_budget_arguments(parser):
+    parser.add_argument(
+        "--check-budgets",
+        action="store_true",
+        help="Check the output against asset size and decode-time budgets (exits 1 if exceeded)"
+    )
+    parser.add_argument(
+        "--budgets",
+        help="JSON file overriding the default asset budgets (implies --check-budgets)"
+    )
+    parser.add_argument(
+        "--baseline",
+        help="JSON file with previous asset metrics to diff against (implies --check-budgets)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ciqual",
+        description="CIQUAL data tooling for the Lym Nutrition app"
+    )
+    parser.add_argument(
+        "--time-imports",
+        action="store_true",
+        help="Print the subcommand import time and the CPU time since interpreter start"
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command", required=True)
+
+    convert = subparsers.add_parser(
+        "convert",
+        help="Convert the official CIQUAL Excel file to the app JSON format"
+    )
+    convert.add_argument("excel_file", help="Path to the official CIQUAL Excel file (.xls)")
+    convert.add_argument("json_file", help="Output path for the JSON file")
+    _add_output_checks(convert)
+
+    filter_ = subparsers.add_parser(
+        "filter",
+        help="Keep only the products shipped with the app"
+    )
+    filter_.add_argument("source_json", help="CIQUAL JSON export to filter")
+    filter_.add_argument("json_file", help="Output path for the filtered JSON file")
+    filter_.add_argument(
+        "--products",
+        help="Text file with one product name per line (default: built-in product list)"
+    )
+    _add_output_checks(filter_)
+
+    validate = subparsers.add_parser(
+        "validate",
+        help="Validate that a JSON file matches the expected app format"
+    )
+    validate.add_argument("json_file", help="JSON file to validate")
+
+    stats = subparsers.add_parser(
+        "stats",
+        help="Show size, record/column counts and decode time of a JSON file"
+    )
+    stats.add_argument("json_file", help="CIQUAL JSON file to measure")
+    _add_budget_arguments(stats)
+    stats.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the current metrics to the baseline file when every budget is met"
+    )
+    stats.add_argument(
+        "--force",
+        action="store_true",
+        help="With --update-baseline, write the baseline even if budgets are exceeded"
+    )
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'stats':
+        if args.update_baseline and not args.baseline:
+            parser.error("stats: --update-baseline requires --baseline")
+        if args.force and not args.update_baseline:
+            parser.error("stats: --force requires --update-baseline")
+
+    start = time.perf_counter()
+    module = importlib.import_module(COMMANDS[args.command], __package__)
+    if args.time_imports:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        startup_ms = time.process_time() * 1000
+        print(
+            f"⏱️  {args.command}: imported in {elapsed_ms:.1f} ms, "
+            f"{startup_ms:.1f} ms CPU since interpreter start",
+            file=sys.stderr
+        )
+
+    sys.exit(module.run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 CIQUAL Data Converter
 ====================
@@ -13,8 +12,8 @@ Usage:
 2. Install dependencies:
    pip install pandas openpyxl
 
-3. Run the script:
-   python convert_ciqual_data.py input_file.xls output_file.json
+3. Run the subcommand (from the ``tools`` directory):
+   python -m ciqual convert input_file.xls output_file.json
 
 Requirements:
 - pandas
@@ -24,10 +23,7 @@ Author: Generated for Lym Nutrition App
 Date: 2024
 """
 
-import pandas as pd
 import json
-import sys
-import argparse
 from pathlib import Path
 
 def convert_ciqual_excel_to_json(excel_file_path: str, output_json_path: str):
@@ -37,7 +33,16 @@ def convert_ciqual_excel_to_json(excel_file_path: str, output_json_path: str):
     Args:
         excel_file_path (str): Path to the official CIQUAL Excel file
         output_json_path (str): Path where the JSON file will be saved
+    
+    Returns:
+        bool: True when the JSON file was written
     """
+    # pandas takes hundreds of milliseconds to import: only load it here
+    try:
+        import pandas as pd
+    except ImportError:
+        print("❌ pandas is required to read the Excel file: pip install pandas openpyxl")
+        return False
     
     print(f"Reading CIQUAL Excel file: {excel_file_path}")
     
@@ -95,80 +100,55 @@ def convert_ciqual_excel_to_json(excel_file_path: str, output_json_path: str):
         
     except Exception as e:
         print(f"❌ Error converting CIQUAL data: {str(e)}")
-        sys.exit(1)
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Convert official CIQUAL Excel data to JSON format for the Lym Nutrition app"
-    )
-    parser.add_argument(
-        "excel_file", 
-        help="Path to the official CIQUAL Excel file (.xls)"
-    )
-    parser.add_argument(
-        "json_file",
-        help="Output path for the JSON file"
-    )
-    parser.add_argument(
-        "--validate-format",
-        action="store_true",
-        help="Validate that the output JSON matches the expected app format"
-    )
+        return False
     
-    args = parser.parse_args()
+    return True
+
+def run(args):
+    """Entry point of ``ciqual convert``; returns the process exit code."""
+    check_budgets = not args.no_budget_check
+    if check_budgets:
+        from .budget import DEFAULT_BASELINE_PATH, load_baseline, load_budgets
+        
+        baseline_path = args.baseline or DEFAULT_BASELINE_PATH
+        # Fail on a bad budgets/baseline file before the conversion runs
+        try:
+            load_budgets(args.budgets)
+            load_baseline(baseline_path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Budget check error: {str(e)}")
+            return 1
     
     # Validate input file exists
     excel_path = Path(args.excel_file)
     if not excel_path.exists():
         print(f"❌ Error: Excel file not found: {args.excel_file}")
-        sys.exit(1)
+        return 1
     
     # Ensure output directory exists
     json_path = Path(args.json_file)
     json_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Convert the data
-    convert_ciqual_excel_to_json(args.excel_file, args.json_file)
+    if not convert_ciqual_excel_to_json(args.excel_file, args.json_file):
+        return 1
     
     if args.validate_format:
-        print("\n🔍 Validating JSON format...")
-        validate_json_format(args.json_file)
-
-def validate_json_format(json_file_path: str):
-    """
-    Validate that the generated JSON matches the expected format for the Flutter app.
-    """
-    try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        from .validate import validate_json_format
         
-        if not isinstance(data, list):
-            print("❌ JSON should be a list of food items")
-            return
-        
-        if len(data) == 0:
-            print("❌ JSON list is empty")
-            return
-        
-        # Check first item structure
-        first_item = data[0]
-        required_fields = [
-            'alim_code',
-            'alim_nom_fr',
-            'alim_grp_nom_fr',
-            'alim_ssgrp_nom_fr'
-        ]
-        
-        missing_fields = [field for field in required_fields if field not in first_item]
-        if missing_fields:
-            print(f"❌ Missing required fields: {missing_fields}")
-            return
-        
-        print("✅ JSON format validation passed")
-        print(f"📊 Total food items: {len(data)}")
+        print("\n🔍 Validating JSON format...")
+        if not validate_json_format(args.json_file):
+            return 1
+    
+    if check_budgets:
+        from .budget import run_budget_check
         
-    except Exception as e:
-        print(f"❌ Validation error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
+        print("\n📏 Checking asset budgets...")
+        try:
+            if not run_budget_check(args.json_file, args.budgets, baseline_path):
+                return 1
+        except (OSError, ValueError) as e:
+            print(f"❌ Budget check error: {str(e)}")
+            return 1
+    
+    return 0
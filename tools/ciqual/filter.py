@@ -1,12 +1,19 @@
-#!/usr/bin/env python3
 """
-Script to filter CIQUAL data based on the specific product list provided by the user.
-This will create a filtered dataset with only the products requested.
+CIQUAL Data Filter
+==================
+
+``ciqual filter``: reduce a CIQUAL JSON export to the products the app ships
+(``PRODUCT_LIST``, or a text file with one product name per line), topped up
+with a few essential products.
+
+Usage (from the ``tools`` directory):
+    python -m ciqual filter ciqual_full.json ../assets/data/common_ciqual.json --validate-format
+
+The product tables below are only built when this subcommand runs.
 """
 
 import json
-import csv
-import os
+from pathlib import Path
 
 # Product list from the user
 PRODUCT_LIST = [
@@ -157,20 +164,28 @@ PRODUCT_LIST = [
     "Noisette",
 ]
 
-def load_ciqual_data():
-    """Load CIQUAL data from CSV file or sample JSON"""
-    sample_file = "/Users/moussa/lym_nutrition/ciqual_sample_data.json"
+def load_ciqual_data(source_file):
+    """Load CIQUAL data from a JSON export, or None if it cannot be read"""
+    try:
+        with open(source_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"❌ Error loading source data: {e}")
+        return None
     
-    # First try to load from sample data
-    if os.path.exists(sample_file):
-        try:
-            with open(sample_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading sample data: {e}")
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        print(f"❌ Error loading source data: {source_file} should contain a list of food items")
+        return None
     
-    # If no sample data, create minimal dataset with essential products
-    return create_minimal_dataset()
+    return data
+
+def load_product_list(products_file):
+    """Load product names from a text file, one per line ('#' starts a comment)"""
+    with open(products_file, 'r', encoding='utf-8') as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.lstrip().startswith('#')
+        ]
 
 def create_minimal_dataset():
     """Create a minimal dataset with the most essential products"""
@@ -478,7 +493,7 @@ def expand_dataset_with_essential_products():
     return essential_products
 
 def save_filtered_data(filtered_data, output_file):
-    """Save filtered data to JSON file"""
+    """Save filtered data to JSON file; returns True on success"""
     try:
         # Ensure we have some data
         if not filtered_data:
@@ -499,16 +514,48 @@ def save_filtered_data(filtered_data, output_file):
             print(f"... and {len(filtered_data) - 5} more products")
             
     except Exception as e:
-        print(f"Error saving data: {e}")
+        print(f"❌ Error saving data: {e}")
+        return False
+    
+    return True
 
-def main():
+def run(args):
+    """Entry point of ``ciqual filter``; returns the process exit code."""
+    source_path = Path(args.source_json)
+    if not source_path.exists():
+        print(f"❌ Error: source JSON file not found: {args.source_json}")
+        return 1
+    
+    check_budgets = not args.no_budget_check
+    if check_budgets:
+        from .budget import DEFAULT_BASELINE_PATH, load_baseline, load_budgets
+        
+        baseline_path = args.baseline or DEFAULT_BASELINE_PATH
+        # Fail on a bad budgets/baseline file before the output is written
+        try:
+            load_budgets(args.budgets)
+            load_baseline(baseline_path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Budget check error: {str(e)}")
+            return 1
+    
+    product_list = PRODUCT_LIST
+    if args.products:
+        try:
+            product_list = load_product_list(args.products)
+        except OSError as e:
+            print(f"❌ Error reading product list: {e}")
+            return 1
+    
     print("Loading CIQUAL data...")
-    ciqual_data = load_ciqual_data()
+    ciqual_data = load_ciqual_data(args.source_json)
+    if ciqual_data is None:
+        return 1
     
     print(f"Loaded {len(ciqual_data)} products from source data")
     
     print("Filtering data based on product list...")
-    filtered_data = filter_products_by_list(ciqual_data, PRODUCT_LIST)
+    filtered_data = filter_products_by_list(ciqual_data, product_list)
     
     # Add essential products to ensure good functionality
     essential_products = expand_dataset_with_essential_products()
@@ -524,8 +571,27 @@ def main():
             seen_names.add(name)
             unique_products.append(product)
     
-    output_file = "/Users/moussa/lym_nutrition/assets/data/common_ciqual.json"
-    save_filtered_data(unique_products, output_file)
-
-if __name__ == "__main__":
-    main()
+    output_path = Path(args.json_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if not save_filtered_data(unique_products, args.json_file):
+        return 1
+    
+    if args.validate_format:
+        from .validate import validate_json_format
+        
+        print("\n🔍 Validating JSON format...")
+        if not validate_json_format(args.json_file):
+            return 1
+    
+    if check_budgets:
+        from .budget import run_budget_check
+        
+        print("\n📏 Checking asset budgets...")
+        try:
+            if not run_budget_check(args.json_file, args.budgets, baseline_path):
+                return 1
+        except (OSError, ValueError) as e:
+            print(f"❌ Budget check error: {str(e)}")
+            return 1
+    
+    return 0
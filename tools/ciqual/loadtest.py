@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+CIQUAL Search Load Test
+=======================
+
+Drives a running ``ciqual.server`` at a fixed request rate over keep-alive
+connections and reports latency percentiles.
+
+Requests are scheduled open-loop: each latency is measured from the time the
+request was due, so a stalled server shows up in p99 instead of silently
+lowering the offered rate.
+
+Usage (from the ``tools`` directory, server started separately):
+    python -m ciqual.loadtest ../assets/data/common_ciqual.json --qps 1000 --duration 10
+
+The JSON file is only used to build realistic queries (words and prefixes of
+food names); ``--queries`` accepts a plain text file with one query per line.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from typing import List
+from urllib.parse import quote
+
+from .search import normalize_string
+
+
+def build_queries(json_file_path: str, count: int = 500, seed: int = 0) -> List[str]:
+    """Pick words, prefixes and full names from the dataset as queries."""
+    with open(json_file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    names = [item.get('alim_nom_fr', '') for item in data if item.get('alim_nom_fr')]
+    if not names:
+        raise ValueError(f"No food names found in {json_file_path}")
+
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        name = rng.choice(names)
+        words = [w for w in name.replace(',', ' ').split() if len(w) > 2] or [name]
+        kind = rng.random()
+        if kind < 0.5:
+            queries.append(rng.choice(words))
+        elif kind < 0.8:
+            word = rng.choice(words)
+            queries.append(word[:rng.randint(min(3, len(word)), len(word))])
+        else:
+            queries.append(name)
+    return queries
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def _worker(host, port, queries, start, interval, offset, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    rng = random.Random(offset)
+    due = start + offset * interval
+    try:
+        while due < deadline:
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            query = quote(rng.choice(queries))
+            writer.write(
+                f"GET /search?q={query}&limit=20 HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1')
+            )
+            status_line = await reader.readline()
+            if not status_line:
+                # Keep-alive connection closed: every later request would fail too
+                raise ConnectionError("connection closed by the server")
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':', 1)[1])
+            try:
+                await reader.readexactly(length)
+            except asyncio.IncompleteReadError:
+                raise ConnectionError("connection closed by the server mid-response") from None
+
+            if b' 200 ' in status_line:
+                latencies.append(time.perf_counter() - due)
+            else:
+                errors.append(status_line.decode('latin-1').strip())
+            due += interval
+    finally:
+        writer.close()
+
+
+async def run_load_test(host: str, port: int, queries: List[str], qps: float,
+                        duration: float, connections: int) -> dict:
+    """
+    Send ``qps`` requests per second for ``duration`` seconds.
+
+    Args:
+        host (str): Server host
+        port (int): Server port
+        queries (List[str]): Queries picked at random for each request
+        qps (float): Total offered rate
+        duration (float): Test length in seconds
+        connections (int): Keep-alive connections sharing the rate
+
+    Returns:
+        dict: Request counts, achieved rate and latency percentiles in ms
+
+    Raises:
+        ConnectionError: When the server cannot be reached or drops a connection
+    """
+    latencies: List[float] = []
+    errors: List[str] = []
+    interval = connections / qps
+    start = time.perf_counter() + 0.1
+    deadline = start + duration
+
+    await asyncio.gather(*(
+        _worker(host, port, queries, start, interval, i / connections, deadline, latencies, errors)
+        for i in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'achieved_qps': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p90_ms': percentile(latencies, 0.90) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': (latencies[-1] * 1000) if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure p50/p99 latency of a running CIQUAL search server"
+    )
+    parser.add_argument("json_file", help="CIQUAL JSON file used to build the queries")
+    parser.add_argument("--host", default="127.0.0.1", help="Server host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Server port (default: 8080)")
+    parser.add_argument("--qps", type=float, default=1000, help="Offered requests per second (default: 1000)")
+    parser.add_argument("--duration", type=float, default=10, help="Test length in seconds (default: 10)")
+    parser.add_argument("--connections", type=int, default=16, help="Keep-alive connections (default: 16)")
+    parser.add_argument("--queries", help="Text file with one query per line instead of generated ones")
+
+    args = parser.parse_args()
+
+    try:
+        if args.queries:
+            with open(args.queries, 'r', encoding='utf-8') as f:
+                queries = [line.strip() for line in f if line.strip()]
+        else:
+            queries = build_queries(args.json_file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error preparing queries: {str(e)}")
+        sys.exit(1)
+
+    distinct = len({normalize_string(q) for q in queries})
+    print(f"🔥 {args.qps:.0f} QPS for {args.duration:.0f}s over {args.connections} connections "
+          f"({distinct} distinct normalized queries)")
+
+    try:
+        report = asyncio.run(run_load_test(
+            args.host, args.port, queries, args.qps, args.duration, args.connections
+        ))
+    except OSError as e:
+        print(f"❌ Server connection error: {str(e)}")
+        sys.exit(1)
+
+    print(f"📊 Requests: {report['requests']}  errors: {report['errors']}  "
+          f"achieved: {report['achieved_qps']:.0f} QPS")
+    print(f"⏱️  p50: {report['p50_ms']:.2f} ms  p90: {report['p90_ms']:.2f} ms  "
+          f"p99: {report['p99_ms']:.2f} ms  max: {report['max_ms']:.2f} ms")
+
+    if report['errors']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+CIQUAL Food Search Engine
+=========================
+
+In-memory search over the exported CIQUAL dataset (``common_ciqual.json``)
+reproducing the scoring of ``CiqualLocalDataSourceImpl.searchFoods``:
+
+    100  normalized name equals the query
+     90  name starts with the query
+     80  query is a whole word of the name
+     70  query found in the group (alim_grp_nom_fr)
+     60  query found in the subgroup (alim_ssgrp_nom_fr)
+     50  query found anywhere else in the name
+
+The app rescans and re-normalizes every food on each query. Here the dataset
+is loaded once and indexed: normalized names are joined in a single string so
+that name candidates come from ``str.find``, and groups/subgroups are matched
+once per distinct value rather than once per food.
+"""
+
+import json
+import re
+from bisect import bisect_right
+from typing import Dict, List, Optional
+
+# Same accent folding as CiqualLocalDataSourceImpl._normalizeString
+_ACCENT_TABLE = str.maketrans({
+    'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
+    'à': 'a', 'â': 'a', 'ä': 'a',
+    'î': 'i', 'ï': 'i',
+    'ô': 'o', 'ö': 'o',
+    'ù': 'u', 'û': 'u', 'ü': 'u',
+    'ç': 'c',
+})
+
+# Separates names in the concatenated index; never produced by normalization
+_NAME_SEPARATOR = '\x00'
+
+SCORE_EXACT = 100
+SCORE_PREFIX = 90
+SCORE_WHOLE_WORD = 80
+SCORE_GROUP = 70
+SCORE_SUBGROUP = 60
+SCORE_PARTIAL = 50
+
+
+def normalize_string(value: Optional[str]) -> str:
+    """Lowercase and strip the accents the app folds when searching."""
+    if not value:
+        return ''
+    return value.lower().translate(_ACCENT_TABLE)
+
+
+def _index_by_value(values: List[str]) -> Dict[str, List[int]]:
+    """Map each distinct non-empty value to the food indices carrying it."""
+    index: Dict[str, List[int]] = {}
+    for i, value in enumerate(values):
+        if value:
+            index.setdefault(value, []).append(i)
+    return index
+
+
+class FoodSearchEngine:
+    """
+    Query engine over a list of CIQUAL food records.
+
+    Records are kept as loaded (the same dictionaries the app feeds to
+    ``CiqualFoodModel.fromJson``); results are returned in score order, ties
+    keeping the dataset order.
+    """
+
+    def __init__(self, foods: List[dict]):
+        self.foods = foods
+        self._names = [normalize_string(food.get('alim_nom_fr')) for food in foods]
+        self._groups = _index_by_value(
+            [normalize_string(food.get('alim_grp_nom_fr')) for food in foods])
+        self._subgroups = _index_by_value(
+            [normalize_string(food.get('alim_ssgrp_nom_fr')) for food in foods])
+        self._by_code = {str(food.get('alim_code', '')): food for food in foods}
+
+        # Start offset of every name inside the concatenated name string
+        self._offsets = []
+        position = 0
+        for name in self._names:
+            self._offsets.append(position)
+            position += len(name) + 1
+        self._name_blob = _NAME_SEPARATOR.join(self._names)
+
+    @classmethod
+    def from_json_file(cls, json_file_path: str) -> 'FoodSearchEngine':
+        """Load an exported CIQUAL JSON file (a list of food items)."""
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"{json_file_path} should contain a list of food items")
+        return cls(data)
+
+    def __len__(self) -> int:
+        return len(self.foods)
+
+    def get_food_by_code(self, code: str) -> Optional[dict]:
+        """Return the food with the given ``alim_code``, or None."""
+        return self._by_code.get(str(code))
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[dict]:
+        """Return the foods matching ``query``, best score first."""
+        indices = self.search_indices(normalize_string(query))
+        if limit is not None:
+            indices = indices[:limit]
+        return [self.foods[i] for i in indices]
+
+    def search_indices(self, normalized_query: str) -> List[int]:
+        """
+        Score an already normalized query.
+
+        Args:
+            normalized_query (str): Output of ``normalize_string``
+
+        Returns:
+            List[int]: Indices into ``foods``, best score first
+        """
+        if not normalized_query:
+            return list(range(len(self.foods)))
+
+        in_group = self._matching_indices(self._groups, normalized_query)
+        in_subgroup = self._matching_indices(self._subgroups, normalized_query)
+        scores: Dict[int, int] = {}
+
+        whole_word = re.compile(r'\b' + re.escape(normalized_query) + r'\b', re.ASCII)
+        for i in self._name_matches(normalized_query):
+            name = self._names[i]
+            if name == normalized_query:
+                scores[i] = SCORE_EXACT
+            elif name.startswith(normalized_query):
+                scores[i] = SCORE_PREFIX
+            elif whole_word.search(name):
+                scores[i] = SCORE_WHOLE_WORD
+            elif i in in_group:
+                scores[i] = SCORE_GROUP
+            elif i in in_subgroup:
+                scores[i] = SCORE_SUBGROUP
+            else:
+                scores[i] = SCORE_PARTIAL
+
+        for i in in_group:
+            scores.setdefault(i, SCORE_GROUP)
+        for i in in_subgroup:
+            scores.setdefault(i, SCORE_SUBGROUP)
+
+        return sorted(scores, key=lambda i: (-scores[i], i))
+
+    def _name_matches(self, normalized_query: str) -> List[int]:
+        """Indices of the foods whose normalized name contains the query."""
+        if _NAME_SEPARATOR in normalized_query:
+            return []
+
+        matches = []
+        blob = self._name_blob
+        offsets = self._offsets
+        position = blob.find(normalized_query)
+        while position != -1:
+            i = bisect_right(offsets, position) - 1
+            matches.append(i)
+            if i + 1 >= len(offsets):
+                break
+            # Skip the rest of this name: one match per food is enough
+            position = blob.find(normalized_query, offsets[i + 1])
+        return matches
+
+    @staticmethod
+    def _matching_indices(index: Dict[str, List[int]], normalized_query: str) -> set:
+        matches = set()
+        for value, indices in index.items():
+            if normalized_query in value:
+                matches.update(indices)
+        return matches
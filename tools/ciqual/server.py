@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+CIQUAL Search Server
+====================
+
+Minimal asyncio HTTP/1.1 server exposing ``FoodSearchEngine`` so backends and
+test harnesses get the same results as the app's local search.
+
+Endpoints:
+    GET /search?q=<query>[&limit=<n>]   foods in app score order
+    GET /foods/<alim_code>              a single food item
+    GET /stats                          dataset size and cache counters
+
+Responses for /search are cached per normalized query (so "Épinard" and
+"epinard" share an entry) in a bounded LRU cache of encoded bodies.
+
+Usage (from the ``tools`` directory):
+    python -m ciqual.server ../assets/data/common_ciqual.json --port 8080
+
+No dependency outside the standard library.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import OrderedDict
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .search import FoodSearchEngine, normalize_string
+
+DEFAULT_CACHE_SIZE = 1024
+MAX_HEADER_LINES = 100
+
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+}
+
+
+class LRUCache:
+    """Bounded mapping evicting the least recently used entry."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+def _encode(payload) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class SearchService:
+    """Routes requests to the engine; independent from the transport."""
+
+    def __init__(self, engine: FoodSearchEngine, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.engine = engine
+        self.cache = LRUCache(cache_size)
+
+    def handle(self, method: str, target: str) -> Tuple[int, bytes]:
+        """Return the status code and JSON body for a request."""
+        if method != 'GET':
+            return 405, _encode({'error': 'only GET is supported'})
+
+        url = urlsplit(target)
+        if url.path == '/search':
+            params = parse_qs(url.query)
+            query = params.get('q', [''])[0]
+            limit = None
+            if 'limit' in params:
+                try:
+                    limit = int(params['limit'][0])
+                except ValueError:
+                    return 400, _encode({'error': 'limit must be an integer'})
+                if limit < 0:
+                    return 400, _encode({'error': 'limit must be non-negative'})
+            return 200, self.search(query, limit)
+
+        if url.path.startswith('/foods/'):
+            food = self.engine.get_food_by_code(unquote(url.path[len('/foods/'):]))
+            if food is None:
+                return 404, _encode({'error': 'food not found'})
+            return 200, _encode(food)
+
+        if url.path == '/stats':
+            return 200, _encode({'foods': len(self.engine), 'cache': self.cache.stats()})
+
+        return 404, _encode({'error': f'unknown path {url.path}'})
+
+    def search(self, query: str, limit: Optional[int] = None) -> bytes:
+        normalized_query = normalize_string(query)
+        key = (normalized_query, limit)
+        body = self.cache.get(key)
+        if body is None:
+            indices = self.engine.search_indices(normalized_query)
+            selected = indices if limit is None else indices[:limit]
+            body = _encode({
+                'query': normalized_query,
+                'count': len(indices),
+                'results': [self.engine.foods[i] for i in selected],
+            })
+            self.cache.put(key, body)
+        return body
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    """Parse one request; returns (method, target, keep_alive) or None on EOF."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    parts = request_line.decode('latin-1').split()
+    if len(parts) != 3:
+        raise ValueError('malformed request line')
+    method, target, version = parts
+
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise ValueError('too many headers')
+
+    # Bodies are not used by any endpoint but must be drained for keep-alive
+    length = int(headers.get('content-length', '0') or 0)
+    if length:
+        await reader.readexactly(length)
+
+    connection = headers.get('connection', '').lower()
+    keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+    return method, target, keep_alive
+
+
+def _format_response(status: int, body: bytes, keep_alive: bool) -> bytes:
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode('latin-1') + body
+
+
+async def serve(service: SearchService, host: str, port: int):
+    """Serve ``service`` until cancelled."""
+
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except (ValueError, asyncio.IncompleteReadError):
+                    writer.write(_format_response(400, _encode({'error': 'bad request'}), False))
+                    break
+                if request is None:
+                    break
+                method, target, keep_alive = request
+                status, body = service.handle(method, target)
+                writer.write(_format_response(status, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle_connection, host, port)
+    print(f"🚀 Serving {len(service.engine)} foods on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve CIQUAL food search with the Lym Nutrition app scoring"
+    )
+    parser.add_argument("json_file", help="Exported CIQUAL JSON file (common_ciqual.json)")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on (default: 8080)")
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help=f"Number of normalized queries kept in the LRU cache (default: {DEFAULT_CACHE_SIZE})"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        engine = FoodSearchEngine.from_json_file(args.json_file)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error loading CIQUAL data: {str(e)}")
+        sys.exit(1)
+
+    try:
+        asyncio.run(serve(SearchService(engine, args.cache_size), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+CIQUAL Dataset Statistics
+=========================
+
+``ciqual stats``: print the size, shape and decode cost of a CIQUAL JSON file
+(the metrics of ``ciqual.budget``) and the number of foods per group.
+With ``--budgets``/``--baseline`` it runs the full budget check instead and
+fails when a budget is exceeded.
+"""
+
+import json
+from collections import Counter
+
+from .budget import METRICS, measure_asset, run_budget_check
+
+
+def run(args):
+    """Entry point of ``ciqual stats``; returns the process exit code."""
+    if args.check_budgets or args.budgets or args.baseline or args.update_baseline:
+        try:
+            ok = run_budget_check(
+                args.json_file, args.budgets, args.baseline, args.update_baseline, args.force
+            )
+        except (OSError, ValueError) as e:
+            print(f"❌ Budget check error: {str(e)}")
+            return 1
+        return 0 if ok else 1
+
+    try:
+        metrics = measure_asset(args.json_file)
+        with open(args.json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error reading CIQUAL data: {str(e)}")
+        return 1
+
+    print(f"📊 Statistics for {args.json_file}")
+    for key, label in METRICS:
+        value = metrics[key]
+        print(f"  {label:<20} {value:.3f}" if isinstance(value, float) else f"  {label:<20} {value}")
+
+    groups = Counter(item.get('alim_grp_nom_fr') or 'Non catégorisé' for item in data)
+    print(f"\n📋 {len(groups)} groups:")
+    for group, count in groups.most_common():
+        print(f"  {count:>6}  {group}")
+    return 0
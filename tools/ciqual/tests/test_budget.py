@@ -0,0 +1,102 @@
+"""Asset measurement and budget checks."""
+
+import json
+
+import pytest
+
+from ciqual.budget import (
+    DEFAULT_BASELINE_PATH,
+    check_budgets,
+    load_baseline,
+    load_budgets,
+    measure_asset,
+    run_budget_check,
+)
+
+FOODS = [
+    {'alim_code': '1', 'alim_nom_fr': 'Carotte, crue'},
+    {'alim_code': '2', 'alim_nom_fr': 'Tomate, crue', 'Sucres (g/100 g)': '2.8'},
+]
+
+
+def write_json(path, payload):
+    path.write_text(json.dumps(payload), encoding='utf-8')
+    return str(path)
+
+
+def test_measure_asset(tmp_path):
+    metrics = measure_asset(write_json(tmp_path / 'foods.json', FOODS), repeats=1)
+    assert metrics['records'] == 2
+    assert metrics['columns'] == 3
+    assert metrics['size_bytes'] == (tmp_path / 'foods.json').stat().st_size
+
+
+@pytest.mark.parametrize('payload', [{'alim_code': '1'}, [1, 2], [FOODS[0], 'x']])
+def test_measure_asset_rejects_non_food_lists(tmp_path, payload):
+    with pytest.raises(ValueError):
+        measure_asset(write_json(tmp_path / 'foods.json', payload))
+
+
+def test_timings_are_not_enforced_by_default():
+    budgets = load_budgets()
+    metrics = {'size_bytes': 1, 'gzip_bytes': 1, 'records': 1, 'columns': 1,
+               'decode_ms': 1e6, 'lookup_ms': 1e6}
+    assert check_budgets(metrics, budgets) == []
+
+
+def test_budgets_file_overrides_defaults(tmp_path):
+    budgets = load_budgets(write_json(tmp_path / 'budgets.json', {'max': {'decode_ms': 5}}))
+    assert budgets['max']['decode_ms'] == 5
+    assert budgets['max']['records'] == 1_000
+
+    with pytest.raises(ValueError):
+        load_budgets(write_json(tmp_path / 'bad.json', {'limits': {}}))
+    with pytest.raises(ValueError):
+        load_budgets(write_json(tmp_path / 'bad.json', [1, 2]))
+
+
+def test_budgets_file_rejects_unknown_metrics(tmp_path):
+    # A typo must not silently disable the cap it was meant to set
+    with pytest.raises(ValueError, match='decode_time'):
+        load_budgets(write_json(tmp_path / 'budgets.json', {'max': {'decode_time': 1}}))
+
+
+@pytest.mark.parametrize('value', ['big', True, [1], {'x': 1}])
+def test_budgets_file_rejects_non_numeric_caps(tmp_path, value):
+    with pytest.raises(ValueError, match='size_bytes'):
+        load_budgets(write_json(tmp_path / 'budgets.json', {'max': {'size_bytes': value}}))
+
+
+def test_budgets_file_accepts_null_to_disable_a_cap(tmp_path):
+    budgets = load_budgets(write_json(tmp_path / 'budgets.json', {'max_growth_pct': {'records': None}}))
+    assert budgets['max_growth_pct']['records'] is None
+
+
+def test_load_baseline(tmp_path):
+    assert load_baseline(None) is None
+    assert load_baseline(str(tmp_path / 'missing.json')) is None
+    assert load_baseline(write_json(tmp_path / 'base.json', {'records': 2})) == {'records': 2}
+
+    with pytest.raises(ValueError):
+        load_baseline(write_json(tmp_path / 'bad.json', [1, 2]))
+    with pytest.raises(ValueError):
+        load_baseline(write_json(tmp_path / 'bad.json', {'records': 'many'}))
+
+
+def test_growth_against_baseline_fails_the_check(tmp_path):
+    asset = write_json(tmp_path / 'foods.json', FOODS)
+    baseline = write_json(tmp_path / 'base.json', {'records': 1})
+    assert run_budget_check(asset, baseline_file_path=baseline) is False
+
+    # A failing run does not become the new reference...
+    run_budget_check(asset, baseline_file_path=baseline, update_baseline=True)
+    assert load_baseline(baseline) == {'records': 1}
+    assert run_budget_check(asset, baseline_file_path=baseline) is False
+
+    # ...unless the change is accepted explicitly
+    run_budget_check(asset, baseline_file_path=baseline, update_baseline=True, force=True)
+    assert run_budget_check(asset, baseline_file_path=baseline) is True
+
+
+def test_committed_baseline_is_valid():
+    assert load_baseline(DEFAULT_BASELINE_PATH)['records'] > 0
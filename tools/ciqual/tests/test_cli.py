@@ -0,0 +1,97 @@
+"""Exit codes of the ``ciqual`` subcommands."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ciqual.cli import main
+
+FOODS = [{
+    'alim_code': '1',
+    'alim_nom_fr': 'Carotte, crue',
+    'alim_grp_nom_fr': 'fruits, légumes, légumineuses et oléagineux',
+    'alim_ssgrp_nom_fr': 'légumes',
+}]
+
+
+def exit_code(*argv):
+    with pytest.raises(SystemExit) as excinfo:
+        main(list(argv))
+    return excinfo.value.code
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'source.json'
+    path.write_text(json.dumps(FOODS), encoding='utf-8')
+    return str(path)
+
+
+def test_package_import_does_not_load_search():
+    # Fresh interpreter: other tests already imported ciqual.search here
+    tools_dir = Path(__file__).resolve().parents[2]
+    script = (
+        "import sys, ciqual; loaded = 'ciqual.search' in sys.modules; "
+        "ciqual.FoodSearchEngine; print(loaded, 'ciqual.search' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=tools_dir, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ['False', 'True']
+
+
+def test_validate(source, tmp_path):
+    assert exit_code('validate', source) == 0
+    empty = tmp_path / 'empty.json'
+    empty.write_text('[]', encoding='utf-8')
+    assert exit_code('validate', str(empty)) == 1
+
+
+def test_filter_writes_output(source, tmp_path):
+    output = tmp_path / 'out' / 'common_ciqual.json'
+    baseline = str(tmp_path / 'baseline.json')
+    assert exit_code('filter', source, str(output), '--validate-format', '--baseline', baseline) == 0
+    names = [item['alim_nom_fr'] for item in json.loads(output.read_text(encoding='utf-8'))]
+    assert 'Carotte, crue' in names
+
+
+def test_filter_checks_budgets_by_default(source, tmp_path):
+    output = str(tmp_path / 'common_ciqual.json')
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps({'records': 1}), encoding='utf-8')
+    assert exit_code('filter', source, output, '--baseline', str(baseline)) == 1
+    assert exit_code('filter', source, output, '--baseline', str(baseline), '--no-budget-check') == 0
+
+
+def test_filter_fails_on_unwritable_output(source, tmp_path):
+    assert exit_code('filter', source, str(tmp_path)) == 1
+
+
+@pytest.mark.parametrize('content', ['not json', '{"alim_code": "1"}'])
+def test_filter_fails_on_unreadable_source(tmp_path, content):
+    bad = tmp_path / 'bad.json'
+    bad.write_text(content, encoding='utf-8')
+    output = tmp_path / 'common_ciqual.json'
+    output.write_text('keep', encoding='utf-8')
+    assert exit_code('filter', str(bad), str(output)) == 1
+    assert output.read_text(encoding='utf-8') == 'keep'
+
+
+def test_filter_checks_budget_files_first(source, tmp_path):
+    output = tmp_path / 'common_ciqual.json'
+    assert exit_code('filter', source, str(output), '--budgets', str(tmp_path / 'typo.json')) == 1
+    assert not output.exists()
+
+
+def test_stats_update_baseline_requires_baseline(source):
+    assert exit_code('stats', source, '--update-baseline') == 2
+    assert exit_code('stats', source, '--force') == 2
+
+
+def test_stats_updates_baseline(source, tmp_path):
+    baseline = tmp_path / 'baseline.json'
+    assert exit_code('stats', source, '--baseline', str(baseline), '--update-baseline') == 0
+    assert json.loads(baseline.read_text(encoding='utf-8'))['records'] == 1
@@ -0,0 +1,32 @@
+"""Load test reporting and connection handling."""
+
+import asyncio
+
+import pytest
+
+from ciqual.loadtest import percentile, run_load_test
+
+
+def test_percentile_is_nearest_rank():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 0.50) == 3.0
+    assert percentile(values, 0.90) == 5.0
+    assert percentile(values, 0.20) == 1.0
+    assert percentile(values, 0.21) == 2.0
+    assert percentile([float(i) for i in range(1, 101)], 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_connection_closed_by_server_stops_the_run():
+    async def scenario():
+        async def close_immediately(reader, writer):
+            writer.close()
+
+        server = await asyncio.start_server(close_immediately, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await run_load_test('127.0.0.1', port, ['pomme'], qps=100,
+                                       duration=5, connections=1)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(asyncio.wait_for(scenario(), timeout=2))
@@ -0,0 +1,145 @@
+"""Parity of FoodSearchEngine with CiqualLocalDataSourceImpl.searchFoods."""
+
+import re
+
+from ciqual.search import (
+    SCORE_EXACT,
+    SCORE_GROUP,
+    SCORE_PARTIAL,
+    SCORE_PREFIX,
+    SCORE_SUBGROUP,
+    SCORE_WHOLE_WORD,
+    FoodSearchEngine,
+    normalize_string,
+)
+
+FRUITS = 'fruits, légumes, légumineuses et oléagineux'
+CEREALES = 'céréales et dérivés'
+
+
+def food(code, name, group=FRUITS, subgroup='légumes'):
+    return {
+        'alim_code': code,
+        'alim_nom_fr': name,
+        'alim_grp_nom_fr': group,
+        'alim_ssgrp_nom_fr': subgroup,
+    }
+
+
+FOODS = [
+    food('1', 'Jus de pommeau, boisson'),                   # partial "pomme"
+    food('2', 'Compote de pomme', subgroup='fruits'),       # whole word "pomme"
+    food('3', 'Pomme, pulpe et peau, crue', subgroup='fruits'),  # prefix "pomme"
+    food('4', 'Pomme'),                                     # exact "pomme"
+    food('5', 'Riz blanc, cru', group=CEREALES, subgroup='riz et dérivés'),
+    food('6', 'Épinard, cru'),
+    food('7', 'Chou-fleur, cru'),
+    food('8', 'Courge doubeurre (butternut), pulpe, crue'),
+    food('9', 'Pâte brisée', group=CEREALES, subgroup='pâtes'),
+    food('10', 'Sans groupe', group=None, subgroup=None),
+]
+
+
+def dart_search(foods, query):
+    """Direct port of the Dart loop, used as the reference."""
+    q = normalize_string(query)
+    if not q:
+        return [f['alim_code'] for f in foods]
+    scored = []
+    for i, f in enumerate(foods):
+        name = normalize_string(f['alim_nom_fr'])
+        if name == q:
+            score = 100
+        elif name.startswith(q):
+            score = 90
+        elif re.search(r'\b' + re.escape(q) + r'\b', name, re.ASCII):
+            score = 80
+        elif f['alim_grp_nom_fr'] is not None and q in normalize_string(f['alim_grp_nom_fr']):
+            score = 70
+        elif f['alim_ssgrp_nom_fr'] is not None and q in normalize_string(f['alim_ssgrp_nom_fr']):
+            score = 60
+        elif q in name:
+            score = 50
+        else:
+            continue
+        scored.append((score, i))
+    scored.sort(key=lambda entry: (-entry[0], entry[1]))
+    return [foods[i]['alim_code'] for _, i in scored]
+
+
+def codes(results):
+    return [f['alim_code'] for f in results]
+
+
+def test_normalize_string_folds_app_accents_only():
+    assert normalize_string('ÉPINARD à la crème') == 'epinard a la creme'
+    assert normalize_string('Maïs, Çà') == 'mais, ca'
+    # Not in the app's folding table
+    assert normalize_string('Ñ œ') == 'ñ œ'
+    assert normalize_string(None) == ''
+
+
+def test_tiers_ordered_best_first():
+    assert codes(FoodSearchEngine(FOODS).search('pomme')) == ['4', '3', '2', '1']
+    assert SCORE_EXACT > SCORE_PREFIX > SCORE_WHOLE_WORD > SCORE_GROUP > SCORE_SUBGROUP > SCORE_PARTIAL
+
+
+def test_group_and_subgroup_tiers_beat_partial_name_match():
+    engine = FoodSearchEngine(FOODS)
+    # "cereales" only matches groups; "riz et" matches the subgroup of 5 and nothing else
+    assert codes(engine.search('céréales')) == ['5', '9']
+    assert codes(engine.search('riz et')) == ['5']
+    # "legumes" matches the group of every fruit/vegetable; ties keep dataset order
+    assert codes(engine.search('légumes')) == ['1', '2', '3', '4', '6', '7', '8']
+
+
+def test_ties_keep_dataset_order():
+    engine = FoodSearchEngine(FOODS)
+    assert codes(engine.search('cru')) == dart_search(FOODS, 'cru')
+    assert codes(engine.search('cru'))[:3] == ['5', '6', '7']
+
+
+def test_accent_folding_on_query_and_names():
+    engine = FoodSearchEngine(FOODS)
+    assert codes(engine.search('EPINARD')) == ['6']
+    assert codes(engine.search('épinard')) == ['6']
+    assert codes(engine.search('pate brisee')) == ['9']
+
+
+def test_whole_word_uses_ascii_boundaries():
+    engine = FoodSearchEngine(FOODS)
+    # "-" is a word boundary: "fleur" is a whole word of "chou-fleur, cru"
+    assert engine.search_indices('fleur') == [6]
+    # A query starting with punctuation needs a word character before it
+    # for \b to match, so "(butternut" is only a partial match
+    assert codes(engine.search('(butternut')) == ['8']
+    assert engine.search_indices('(butternut') == [7]
+    assert codes(engine.search('(butternut')) == dart_search(FOODS, '(butternut')
+
+
+def test_empty_query_returns_everything_in_order():
+    engine = FoodSearchEngine(FOODS)
+    assert codes(engine.search('')) == [f['alim_code'] for f in FOODS]
+    assert len(engine.search('', limit=3)) == 3
+
+
+def test_separator_in_query_matches_no_name():
+    engine = FoodSearchEngine(FOODS)
+    # Would otherwise span two adjacent names in the concatenated index
+    assert engine.search_indices('boisson\x00compote') == []
+    assert engine.search_indices('\x00') == []
+
+
+def test_matches_reference_on_many_queries():
+    engine = FoodSearchEngine(FOODS)
+    queries = ['pomme', 'POMME', 'cru', 'crue', 'e', ' ', ',', 'fruits', 'legum',
+               'riz', 'pulpe et', 'chou', 'fleur', 'sans', 'zzz', 'pâtes', 'de']
+    for query in queries:
+        assert codes(engine.search(query)) == dart_search(FOODS, query), query
+
+
+def test_get_food_by_code():
+    engine = FoodSearchEngine(FOODS)
+    assert engine.get_food_by_code('6')['alim_nom_fr'] == 'Épinard, cru'
+    assert engine.get_food_by_code(6)['alim_nom_fr'] == 'Épinard, cru'
+    assert engine.get_food_by_code('404') is None
@@ -0,0 +1,84 @@
+"""LRUCache and SearchService routing (no sockets involved)."""
+
+import json
+
+from ciqual.search import FoodSearchEngine
+from ciqual.server import LRUCache, SearchService
+
+FOODS = [
+    {'alim_code': '1', 'alim_nom_fr': 'Épinard, cru',
+     'alim_grp_nom_fr': 'légumes', 'alim_ssgrp_nom_fr': 'légumes'},
+    {'alim_code': '2', 'alim_nom_fr': 'Épinard, surgelé, cru',
+     'alim_grp_nom_fr': 'légumes', 'alim_ssgrp_nom_fr': 'légumes'},
+]
+
+
+def make_service(cache_size=8):
+    return SearchService(FoodSearchEngine(FOODS), cache_size)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # "b" becomes the oldest entry
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+    assert cache.stats() == {'size': 2, 'maxsize': 2, 'hits': 3, 'misses': 1}
+
+
+def test_lru_cache_with_zero_size_stores_nothing():
+    cache = LRUCache(0)
+    cache.put('a', 1)
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_search_returns_results_and_count():
+    status, body = make_service().handle('GET', '/search?q=epinard&limit=1')
+    payload = json.loads(body)
+    assert status == 200
+    assert payload['count'] == 2
+    assert [f['alim_code'] for f in payload['results']] == ['1']
+
+
+def test_search_cache_is_keyed_on_normalized_query():
+    service = make_service()
+    service.handle('GET', '/search?q=%C3%89pinard')
+    service.handle('GET', '/search?q=epinard')
+    assert service.cache.stats()['hits'] == 1
+    assert service.cache.stats()['misses'] == 1
+
+
+def test_search_limit_validation():
+    service = make_service()
+    status, body = service.handle('GET', '/search?q=epinard&limit=abc')
+    assert status == 400
+    assert json.loads(body)['error'] == 'limit must be an integer'
+
+    status, body = service.handle('GET', '/search?q=epinard&limit=-1')
+    assert status == 400
+    assert json.loads(body)['error'] == 'limit must be non-negative'
+
+    status, body = service.handle('GET', '/search?q=epinard&limit=0')
+    assert status == 200
+    assert json.loads(body)['results'] == []
+
+
+def test_food_by_code():
+    service = make_service()
+    status, body = service.handle('GET', '/foods/2')
+    assert status == 200
+    assert json.loads(body)['alim_nom_fr'] == 'Épinard, surgelé, cru'
+
+    status, _ = service.handle('GET', '/foods/404')
+    assert status == 404
+
+
+def test_unknown_path_and_method():
+    service = make_service()
+    assert service.handle('GET', '/nope')[0] == 404
+    assert service.handle('POST', '/search?q=epinard')[0] == 405
@@ -0,0 +1,57 @@
+"""
+CIQUAL JSON Format Validation
+=============================
+
+``ciqual validate``: check that a JSON file has the shape the Flutter app
+expects (a non-empty list of food items with the ``alim_*`` fields read by
+``CiqualFoodModel.fromJson``). Only needs the standard library.
+"""
+
+import json
+
+REQUIRED_FIELDS = [
+    'alim_code',
+    'alim_nom_fr',
+    'alim_grp_nom_fr',
+    'alim_ssgrp_nom_fr'
+]
+
+
+def validate_json_format(json_file_path: str) -> bool:
+    """
+    Validate that the generated JSON matches the expected format for the Flutter app.
+
+    Returns:
+        bool: True when the format is valid
+    """
+    try:
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if not isinstance(data, list):
+            print("❌ JSON should be a list of food items")
+            return False
+
+        if len(data) == 0:
+            print("❌ JSON list is empty")
+            return False
+
+        # Check first item structure
+        first_item = data[0]
+        missing_fields = [field for field in REQUIRED_FIELDS if field not in first_item]
+        if missing_fields:
+            print(f"❌ Missing required fields: {missing_fields}")
+            return False
+
+        print("✅ JSON format validation passed")
+        print(f"📊 Total food items: {len(data)}")
+        return True
+
+    except Exception as e:
+        print(f"❌ Validation error: {str(e)}")
+        return False
+
+
+def run(args):
+    """Entry point of ``ciqual validate``; returns the process exit code."""
+    return 0 if validate_json_format(args.json_file) else 1